@@ -5,13 +5,71 @@ This module implements the main Stock Agent that orchestrates the LangGraph work
 for processing stock-related queries using OpenAI API.
 """
 
-from typing import Dict, Any, Optional
+import asyncio
+import json
+from functools import partial
+from typing import Dict, Any, AsyncIterator, Optional, Tuple
+from langchain_core.messages import HumanMessage
 from app.config import Settings
-from app.llm import OpenAIClient
+from app.llm import OpenAIClient, ResponseCache, close_shared_http_client
 from app.graph import create_agent_graph, AgentState
 from app.graph.workflow import get_graph_structure
 
 
+# Built LLM clients and compiled graphs, keyed by the settings they depend on
+_llm_and_graph_cache: Dict[Tuple[Any, ...], Tuple[OpenAIClient, Any]] = {}
+
+
+def _llm_settings_signature(settings: Settings) -> Tuple[Any, ...]:
+    """
+    Get the settings fields that configure the ChatOpenAI model.
+    
+    The concurrency and connection-pool limits are left out: the semaphore and
+    HTTP pool are process-wide and sized by the first client created.
+    """
+    return (
+        settings.openai_api_key,
+        settings.agent_model,
+        settings.agent_temperature,
+        settings.agent_max_tokens,
+        settings.llm_request_timeout_seconds
+    )
+
+
+def _build_llm_and_graph(settings: Settings) -> Tuple[OpenAIClient, Any]:
+    """
+    Build the LLM client and compile the workflow graph once per configuration.
+    
+    Compiling the graph validates every node and edge, so agents sharing the
+    same model settings reuse one client and one compiled graph instead of
+    rebuilding them on each instantiation.
+    
+    Args:
+        settings: Application settings the client is built from
+        
+    Returns:
+        Tuple of (OpenAIClient, compiled StateGraph)
+    """
+    key = _llm_settings_signature(settings)
+    cached = _llm_and_graph_cache.get(key)
+    if cached is None:
+        llm_client = OpenAIClient(settings)
+        cached = (llm_client, create_agent_graph(llm_client))
+        _llm_and_graph_cache[key] = cached
+    return cached
+
+
+async def close_agent_resources() -> None:
+    """
+    Release the LLM clients shared between agents at application shutdown.
+    
+    Cached clients hold the pooled HTTP client, so the cache is cleared along
+    with closing the pool; the next startup then builds fresh ones.
+    """
+    _llm_and_graph_cache.clear()
+    await close_shared_http_client()
+
+
 class StockAgent:
     """
     LangGraph-based AI agent for stock information queries.
@@ -36,11 +94,40 @@ class StockAgent:
         """
         self.settings = settings
         
-        # Initialize OpenAI client (handles all API communication)
-        self.llm_client = OpenAIClient(settings)
+        # Initialize OpenAI client (handles all API communication) and the
+        # LangGraph workflow, shared across agents with the same model settings
+        self.llm_client, self.graph = _build_llm_and_graph(settings)
         
-        # Create the LangGraph workflow
-        self.graph = create_agent_graph(self.llm_client)
+        # Cache responses for repeated queries to skip redundant LLM calls
+        self.response_cache = ResponseCache(
+            ttl_seconds=settings.response_cache_ttl_seconds,
+            max_entries=settings.response_cache_max_entries
+        )
+        
+        # Identical queries already being answered, keyed by cache key, so
+        # concurrent duplicates share one LLM call instead of each paying for it
+        self._inflight: Dict[str, asyncio.Task] = {}
+    
+    @staticmethod
+    def _normalize_query(query: str) -> str:
+        """Collapse runs of whitespace so the prompt and cache key agree"""
+        return " ".join(query.split())
+    
+    def _cache_key(self, query: str, context: Optional[Dict[str, Any]]) -> str:
+        """Build the response-cache key for a query and its context"""
+        # Uses the same normalized query that _build_messages sends, so only
+        # identical prompts share a cached or coalesced answer
+        return ResponseCache.make_key(
+            self.settings.agent_model,
+            self._normalize_query(query),
+            json.dumps(context, sort_keys=True, default=str)
+        )
+    
+    def _build_messages(self, query: str) -> list:
+        """Build the LLM prompt messages for a query"""
+        # Create a simple prompt
+        prompt = f"You are a stock market analyst. {self._normalize_query(query)}"
+        return [HumanMessage(content=prompt)]
     
     async def process_query(
         self,
@@ -58,16 +145,71 @@ class StockAgent:
             The agent's response string
         """
         # For now, just use the LLM directly without graph
-        from langchain_core.messages import HumanMessage
+        # Serve repeated queries from the cache
+        cache_key = self._cache_key(query, context)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
-        # Create a simple prompt
-        prompt = f"You are a stock market analyst. {query}"
-        
-        # Call the LLM
-        response = await self.llm_client.invoke([HumanMessage(content=prompt)])
+        # Run the LLM call in a detached task shared by every identical query
+        # in flight. Each caller awaits it through a shield, so a client that
+        # disconnects cancels only its own wait, never the shared work.
+        task = self._inflight.get(cache_key)
+        if task is None:
+            # No await between the lookup above and this registration, so no
+            # lock is needed on the single event loop
+            task = asyncio.create_task(self._invoke_and_cache(query, cache_key))
+            task.add_done_callback(partial(self._on_inflight_done, cache_key))
+            self._inflight[cache_key] = task
         
+        return await asyncio.shield(task)
+    
+    async def _invoke_and_cache(self, query: str, cache_key: str) -> str:
+        """Call the LLM for a query and cache the response text"""
+        response = await self.llm_client.invoke(self._build_messages(query))
+        self.response_cache.set(cache_key, response.content)
         return response.content
     
+    def _on_inflight_done(self, cache_key: str, task: asyncio.Task) -> None:
+        """Unregister a finished in-flight task"""
+        if self._inflight.get(cache_key) is task:
+            del self._inflight[cache_key]
+        # Mark the outcome as retrieved even if every caller went away
+        if not task.cancelled():
+            task.exception()
+    
+    async def stream_query(
+        self,
+        query: str,
+        context: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Process a user query, yielding the response as it is generated.
+        
+        Clients can render the first tokens as soon as they arrive instead of
+        waiting for the full completion. The assembled response is cached
+        exactly like process_query.
+        
+        Args:
+            query: User's question about stocks
+            context: Optional additional context (e.g., {"timeframe": "1 week"})
+            
+        Yields:
+            Chunks of the agent's response text
+        """
+        cache_key = self._cache_key(query, context)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+        
+        chunks = []
+        async for chunk in self.llm_client.stream(self._build_messages(query)):
+            chunks.append(chunk)
+            yield chunk
+        
+        self.response_cache.set(cache_key, "".join(chunks))
+    
     def get_graph_structure(self) -> Dict[str, Any]:
         """
         Get the structure of the agent's graph for debugging/visualization.
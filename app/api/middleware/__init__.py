@@ -2,6 +2,6 @@
 Middleware package for the API layer.
 """
 
-from .auth import get_current_user
+from .auth import get_current_user, close_http_client
 
-__all__ = ["get_current_user"]
+__all__ = ["get_current_user", "close_http_client"]
@@ -7,14 +7,19 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Optional, Dict, Any
 import jwt
+from jwt import PyJWK
 import os
 from dotenv import load_dotenv
-import requests
+import httpx
 from functools import lru_cache
-from datetime import datetime
+import asyncio
+import logging
+import time
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # JWT Configuration from Stack Auth
 NEON_AUTH_ISSUER_URI = os.getenv(
     "NEON_AUTH_ISSUER_URI",
@@ -30,9 +35,18 @@ JWT_ISSUER = os.getenv("JWT_ISSUER", "https://api.stack-auth.com")
 # Bearer token security scheme
 security = HTTPBearer(auto_error=False)
 
-# Cache for JWKS (JSON Web Key Set) to avoid repeated requests
-_jwks_cache = {}
-_jwks_cache_time = None
+# Cache of parsed JWKS (JSON Web Key Set) public keys, keyed by kid, so key
+# material is decoded once per refresh instead of on every request
+_jwks_cache: Dict[str, Any] = {}
+_jwks_cache_time = 0.0
+JWKS_CACHE_TTL_SECONDS = 3600
+
+# Serializes JWKS refreshes so concurrent requests on a cold or expired cache
+# wait for one fetch instead of each hitting Stack Auth
+_jwks_lock: Optional[asyncio.Lock] = None
+
+# Async HTTP client for JWKS refreshes, so a cache miss does not block the event loop
+_http_client: Optional[httpx.AsyncClient] = None
 
 
 @lru_cache(maxsize=1)
@@ -41,48 +55,108 @@ def get_jwks_url():
     return STACK_JWKS_URL
 
 
-def get_public_key(token: str) -> Optional[Dict[str, Any]]:
+def get_http_client() -> httpx.AsyncClient:
+    """Get the async HTTP client used for JWKS requests, creating it on first use"""
+    global _http_client
+    
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(timeout=5.0)
+    return _http_client
+
+
+def get_jwks_lock() -> asyncio.Lock:
+    """Get the lock guarding JWKS refreshes, creating it on first use"""
+    global _jwks_lock
+    
+    if _jwks_lock is None:
+        _jwks_lock = asyncio.Lock()
+    return _jwks_lock
+
+
+async def close_http_client() -> None:
+    """
+    Close the JWKS HTTP client, releasing pooled connections.
+    
+    Also drops the refresh lock, which is bound to the event loop that first
+    waited on it.
+    """
+    global _http_client, _jwks_lock
+    
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+    _jwks_lock = None
+
+
+def _jwks_cache_stale() -> bool:
+    """Check whether the JWKS cache is empty or older than its TTL"""
+    return not _jwks_cache or (time.monotonic() - _jwks_cache_time > JWKS_CACHE_TTL_SECONDS)
+
+
+def _parse_jwks(jwks: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Parse every key in a JWKS document into a verification key object.
+    
+    Args:
+        jwks: JWKS document as returned by Stack Auth
+        
+    Returns:
+        Dictionary mapping kid to the parsed public key
+    """
+    keys = {}
+    for key_data in jwks.get("keys", []):
+        kid = key_data.get("kid")
+        if not kid:
+            continue
+        try:
+            keys[kid] = PyJWK.from_dict(key_data).key
+        except jwt.PyJWKError as e:
+            logger.warning("Skipping unusable JWKS key %s: %s", kid, e)
+    return keys
+
+
+async def get_public_key(kid: Optional[str]) -> Optional[Any]:
     """
     Fetch the public key from Stack Auth's JWKS endpoint.
-    Caches the result to avoid repeated requests.
+    Caches the parsed keys to avoid repeated requests and key decoding.
+    
+    Args:
+        kid: Key ID from the already-parsed token header
+        
+    Returns:
+        Parsed public key for the kid, or None if it cannot be resolved
     """
     global _jwks_cache, _jwks_cache_time
     
     try:
         # Refresh cache every hour or if empty
-        now = datetime.utcnow().timestamp()
-        if not _jwks_cache or (now - _jwks_cache_time > 3600):
-            jwks_url = get_jwks_url()
-            print(f"🔑 Fetching JWKS from: {jwks_url}")
-            response = requests.get(jwks_url, timeout=5)
-            response.raise_for_status()
-            _jwks_cache = response.json()
-            _jwks_cache_time = now
-            print(f"🔑 JWKS refreshed with {len(_jwks_cache.get('keys', []))} keys")
-        
-        # Get kid (key ID) from token header
-        header = jwt.get_unverified_header(token)
-        kid = header.get("kid")
-        print(f"🔑 Token kid: {kid}, Token alg: {header.get('alg')}")
+        if _jwks_cache_stale():
+            async with get_jwks_lock():
+                # Another request may have refreshed the keys while this one waited
+                if _jwks_cache_stale():
+                    jwks_url = get_jwks_url()
+                    logger.info("Fetching JWKS from: %s", jwks_url)
+                    response = await get_http_client().get(jwks_url)
+                    response.raise_for_status()
+                    _jwks_cache = _parse_jwks(response.json())
+                    _jwks_cache_time = time.monotonic()
+                    logger.info("JWKS refreshed with %d keys", len(_jwks_cache))
         
         if not kid or not _jwks_cache:
-            print(f"🔑 Missing kid or cache - kid: {kid}, cache: {bool(_jwks_cache)}")
+            logger.debug("Missing kid or cache - kid: %s, cache: %s", kid, bool(_jwks_cache))
             return None
         
         # Find the matching key
-        for key in _jwks_cache.get("keys", []):
-            if key.get("kid") == kid:
-                print(f"🔑 Found matching key for kid: {kid}")
-                return key
+        public_key = _jwks_cache.get(kid)
+        if public_key is not None:
+            logger.debug("Found matching key for kid: %s", kid)
+            return public_key
         
-        print(f"🔑 No matching key found for kid: {kid}")
-        print(f"🔑 Available kids: {[k.get('kid') for k in _jwks_cache.get('keys', [])]}")
+        logger.debug("No matching key found for kid: %s (available: %s)", kid, list(_jwks_cache))
         return None
         
     except Exception as e:
-        print(f"❌ Error fetching JWKS: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error fetching JWKS: %s", e)
         return None
 
 
@@ -144,23 +218,20 @@ async def get_current_user(
         )
     
     try:
-        # First, decode without verification to get header info
+        # Decode the header once without verification to get the key ID
         header = jwt.get_unverified_header(token)
+        logger.debug("Token kid: %s, Token alg: %s", header.get("kid"), header.get("alg"))
         
-        # Get the public key from Stack Auth's JWKS
-        public_key_data = get_public_key(token)
+        # Get the parsed public key from Stack Auth's JWKS
+        public_key = await get_public_key(header.get("kid"))
         
-        if not public_key_data:
+        if public_key is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Unable to verify token: public key not found",
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
-        # Convert JWKS public key to PEM format
-        from jwt import PyJWK
-        public_key = PyJWK.from_dict(public_key_data).key
-        
         # Decode and validate JWT token
         # Get the expected audience from environment
         expected_audience = "142ba44a-dc12-4035-a4e8-a043e425f201"  # Stack Auth project ID
@@ -195,14 +266,14 @@ async def get_current_user(
         }
         
     except jwt.ExpiredSignatureError as e:
-        print(f"🔐 Token validation failed - Expired: {str(e)}")
+        logger.debug("Token validation failed - Expired: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token has expired",
             headers={"WWW-Authenticate": "Bearer"},
         )
     except (jwt.PyJWTError, jwt.InvalidAlgorithmError) as e:
-        print(f"🔐 Token validation failed - JWT Error: {str(e)}")
+        logger.debug("Token validation failed - JWT Error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Invalid token: {str(e)}",
@@ -212,9 +283,7 @@ async def get_current_user(
         # Re-raise HTTP exceptions as-is
         raise
     except Exception as e:
-        print(f"🔐 Token validation failed - Unexpected error: {type(e).__name__}: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Token validation failed - Unexpected error: %s: %s", type(e).__name__, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Authentication error: {str(e)}"
@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Request, Body
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field
 from typing import Optional
+import logging
 
 from app.database import get_db
 from app.services import StockAnalysisService
@@ -14,6 +15,8 @@ from app.agent import StockAgent
 
 router = APIRouter()
 
+logger = logging.getLogger(__name__)
+
 
 def get_agent_from_request(request: Request) -> Optional[StockAgent]:
     """Get the agent from the request's app state"""
@@ -80,9 +83,7 @@ async def analyze_price_action(
         return PriceActionResponse(**result)
         
     except Exception as e:
-        print(f"❌ Error in price action analysis: {type(e).__name__}: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in price action analysis: %s: %s", type(e).__name__, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to analyze ticker: {str(e)}"
@@ -5,7 +5,7 @@ User endpoints for user management and statistics.
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from app.database import get_db
 from app.services import StockAnalysisService
@@ -21,8 +21,17 @@ class UserStatsResponse(BaseModel):
     recent_requests: List[Dict[str, Any]]
 
 
+class UserInfoResponse(BaseModel):
+    """Response model for the authenticated user's token information."""
+    user_id: str
+    email: Optional[str] = None
+    username: Optional[str] = None
+
+
+# Plain `def` so FastAPI runs it in the threadpool: the SQLAlchemy session is
+# synchronous and would otherwise block the event loop during the query
 @router.get("/me/stats", response_model=UserStatsResponse, status_code=status.HTTP_200_OK)
-async def get_my_stats(
+def get_my_stats(
     current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -57,7 +66,7 @@ async def get_my_stats(
         )
 
 
-@router.get("/me", status_code=status.HTTP_200_OK)
+@router.get("/me", response_model=UserInfoResponse, status_code=status.HTTP_200_OK)
 async def get_current_user_info(
     current_user: dict = Depends(get_current_user)
 ):
@@ -72,8 +81,8 @@ async def get_current_user_info(
     Returns:
         User information from the JWT token
     """
-    return {
-        "user_id": current_user["user_id"],
-        "email": current_user.get("email"),
-        "username": current_user.get("username")
-    }
+    return UserInfoResponse(
+        user_id=current_user["user_id"],
+        email=current_user.get("email"),
+        username=current_user.get("username")
+    )
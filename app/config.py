@@ -4,7 +4,7 @@ Configuration management using Pydantic Settings
 
 from pydantic_settings import BaseSettings
 from functools import lru_cache
-from typing import Optional
+from typing import Literal, Optional
 
 
 class Settings(BaseSettings):
@@ -14,6 +14,7 @@ class Settings(BaseSettings):
     app_name: str = "StockInformationWebsiteAIBackend"
     app_version: str = "1.0.0"
     debug: bool = True
+    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO"
     
     # Server Configuration
     host: str = "0.0.0.0"
@@ -39,6 +40,16 @@ class Settings(BaseSettings):
     agent_temperature: float = 0.7
     agent_max_tokens: int = 2000
     
+    # LLM HTTP Connection Pool Configuration
+    llm_max_concurrency: int = 32  # Max in-flight LLM requests; size to your rate limit tier
+    llm_request_timeout_seconds: float = 60.0  # Per-request OpenAI timeout, so a stalled call frees its slot
+    llm_max_connections: int = 100
+    llm_max_keepalive_connections: int = 32  # Keep >= llm_max_concurrency
+    
+    # Response Cache Configuration
+    response_cache_ttl_seconds: int = 3600  # 0 disables the cache
+    response_cache_max_entries: int = 1024
+    
     model_config = {
         "env_file": ".env",
         "case_sensitive": False
@@ -0,0 +1,45 @@
+"""Replace the api_usage user_id index with (user_id, created_at)
+
+Tables are created by Base.metadata.create_all at startup, so this is the
+base revision. It uses IF [NOT] EXISTS so it applies cleanly both to
+databases created before the composite index existed and to ones created
+after.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_api_usage_user_id_created_at",
+        "api_usage",
+        ["user_id", "created_at"],
+        if_not_exists=True,
+    )
+    # The composite index covers lookups by user_id alone
+    op.drop_index("ix_api_usage_user_id", table_name="api_usage", if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_api_usage_user_id",
+        "api_usage",
+        ["user_id"],
+        if_not_exists=True,
+    )
+    op.drop_index(
+        "ix_api_usage_user_id_created_at",
+        table_name="api_usage",
+        if_exists=True,
+    )
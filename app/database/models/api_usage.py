@@ -2,7 +2,7 @@
 API usage tracking model.
 """
 
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Text
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Text, Index
 from sqlalchemy.sql import func
 from app.database.base import Base
 
@@ -12,9 +12,15 @@ class ApiUsage(Base):
     Tracks API usage for rate limiting and analytics.
     """
     __tablename__ = "api_usage"
+    __table_args__ = (
+        # Serves "recent requests for a user" (WHERE user_id ORDER BY created_at DESC
+        # LIMIT n) as an index range scan instead of a sort over all user rows;
+        # its leading column also serves plain user_id lookups
+        Index("ix_api_usage_user_id_created_at", "user_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(String, ForeignKey("users.id"), nullable=False)
     endpoint = Column(String, nullable=False)
     ticker = Column(String, nullable=True, index=True)  # Stock ticker being analyzed
     request_data = Column(Text, nullable=True)  # JSON string of request parameters
@@ -4,10 +4,25 @@ Generates the final user-facing response
 """
 
 from typing import Dict, Any
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import SystemMessage, HumanMessage
 from app.llm import OpenAIClient
 
 
+# The synthesis prompts have no per-request fields, so build them once
+SYSTEM_MESSAGE = SystemMessage(
+    content=(
+        "You are an expert stock market analyst. "
+        "You write the final answer to the user's query from prior analyses."
+    )
+)
+
+SUMMARY_INSTRUCTION = (
+    "Combine the analyses below into a clear, concise, actionable response "
+    "that directly answers the user's original query. "
+    "Keep it professional and data-driven."
+)
+
+
 async def generate_response_node(
     state: Dict[str, Any],
     llm_client: OpenAIClient
@@ -18,29 +33,33 @@ async def generate_response_node(
     This node synthesizes the analysis into a clear, actionable response
     that directly addresses the user's query.
     
+    The prompt is built from the query and the analysis results in metadata
+    rather than the merged message history, whose branch order is not fixed.
+    
     Args:
-        state: Current agent state with full message history
+        state: Current agent state with understanding and processing results
         llm_client: OpenAI client for LLM calls
         
     Returns:
-        Updated agent state with final response
+        State update with the final response
     """
-    final_message = HumanMessage(
+    metadata = state.get("metadata") or {}
+    synthesis_message = HumanMessage(
         content=(
-            "Summarize your analysis into a clear, concise, actionable response "
-            "that directly answers the user's original query. "
-            "Keep it professional and data-driven."
+            f"{SUMMARY_INSTRUCTION}\n\n"
+            f"User query: '{state['query']}'\n\n"
+            f"Query understanding:\n{metadata.get('understanding', '')}\n\n"
+            f"Detailed analysis:\n{metadata.get('processing', '')}"
         )
     )
-    
-    messages = state["messages"] + [final_message]
+    messages = [SYSTEM_MESSAGE, synthesis_message]
     
     # Call OpenAI API through client
     response = await llm_client.invoke(messages)
     
-    # Update state with final response
-    state["response"] = response.content
-    state["messages"] = messages + [response]
-    state["metadata"]["final_response"] = True
-    
-    return state
+    # Return only the keys this node updates; reducers merge them into state
+    return {
+        "response": response.content,
+        "messages": [synthesis_message, response],
+        "metadata": {"final_response": True}
+    }
@@ -15,34 +15,37 @@ async def process_query_node(
     """
     Second step: Process the query with context.
     
-    This node takes the analyzed query and any additional context
-    to generate detailed analysis and insights.
+    This node takes the original query and any additional context
+    to generate detailed analysis and insights. It does not depend on
+    the understanding step, so both run concurrently in the graph.
     
     Args:
-        state: Current agent state with previous messages
+        state: Current agent state
         llm_client: OpenAI client for LLM calls
         
     Returns:
-        Updated agent state with processing results
+        State update with the exchanged messages and processing results
     """
     context_info = ""
     if state.get("context"):
         context_info = f"\n\nAdditional context: {state['context']}"
     
+    # Static instructions go first and the per-request query/context last,
+    # matching the ordering used by the other prompts in the graph
     processing_message = HumanMessage(
         content=(
-            f"Based on the query: '{state['query']}'{context_info}\n\n"
-            "Provide a detailed analysis with specific data points and insights."
+            "Provide a detailed analysis with specific data points and insights.\n\n"
+            f"Query: '{state['query']}'{context_info}"
         )
     )
     
-    messages = state["messages"] + [processing_message]
+    messages = [processing_message]
     
     # Call OpenAI API through client
     response = await llm_client.invoke(messages)
     
-    # Update state
-    state["messages"] = messages + [response]
-    state["metadata"]["processing"] = response.content
-    
-    return state
+    # Return only the keys this node updates; reducers merge them into state
+    return {
+        "messages": messages + [response],
+        "metadata": {"processing": response.content}
+    }
@@ -8,6 +8,17 @@ from langchain_core.messages import SystemMessage, HumanMessage
 from app.llm import OpenAIClient
 
 
+# The system prompt takes no arguments, so build the message once at import
+# instead of on every node invocation
+SYSTEM_MESSAGE = SystemMessage(
+    content=(
+        "You are an expert stock market analyst. "
+        "Analyze the user's query to understand their intent and identify key topics. "
+        "Respond with a brief analysis of what the user is asking."
+    )
+)
+
+
 async def understand_query_node(
     state: Dict[str, Any],
     llm_client: OpenAIClient
@@ -23,24 +34,16 @@ async def understand_query_node(
         llm_client: OpenAI client for LLM calls
         
     Returns:
-        Updated agent state with understanding metadata
+        State update with the exchanged messages and understanding metadata
     """
-    system_message = SystemMessage(
-        content=(
-            "You are an expert stock market analyst. "
-            "Analyze the user's query to understand their intent and identify key topics. "
-            "Respond with a brief analysis of what the user is asking."
-        )
-    )
-    
     human_message = HumanMessage(content=state["query"])
-    messages = [system_message, human_message]
+    messages = [SYSTEM_MESSAGE, human_message]
     
     # Call OpenAI API through client
     response = await llm_client.invoke(messages)
     
-    # Update state
-    state["messages"] = messages + [response]
-    state["metadata"]["understanding"] = response.content
-    
-    return state
+    # Return only the keys this node updates; reducers merge them into state
+    return {
+        "messages": messages + [response],
+        "metadata": {"understanding": response.content}
+    }
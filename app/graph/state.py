@@ -7,6 +7,16 @@ from langchain_core.messages import BaseMessage
 import operator
 
 
+def merge_metadata(left: Dict[str, Any], right: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reducer for the metadata channel.
+    
+    Parallel nodes each contribute their own metadata keys in the same step,
+    so updates are merged instead of overwriting one another.
+    """
+    return {**(left or {}), **(right or {})}
+
+
 class AgentState(dict):
     """
     State definition for the LangGraph agent.
@@ -20,14 +30,15 @@ class AgentState(dict):
     """
     
     def __init__(self):
-        super().__init__()
-        self.update({
-            "messages": [],
-            "query": "",
-            "context": None,
-            "response": "",
-            "metadata": {}
-        })
+        # Populate in the dict constructor itself rather than building an
+        # empty dict and then growing it through update()
+        super().__init__(
+            messages=[],
+            query="",
+            context=None,
+            response="",
+            metadata={}
+        )
 
 
 # TypedDict-like structure for type hints
@@ -39,4 +50,4 @@ class AgentStateDict(TypedDict):
     query: str
     context: Optional[Dict[str, Any]]
     response: str
-    metadata: Dict[str, Any]
+    metadata: Annotated[Dict[str, Any], merge_metadata]
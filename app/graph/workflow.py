@@ -2,9 +2,11 @@
 LangGraph workflow definition and graph construction
 """
 
-from langgraph.graph import StateGraph, END
+from functools import partial
+from langgraph.graph import StateGraph, START, END
 from typing import Dict, Any
 from app.llm import OpenAIClient
+from app.graph.state import AgentStateDict
 from app.graph.nodes import (
     understand_query_node,
     process_query_node,
@@ -16,10 +18,11 @@ def create_agent_graph(llm_client: OpenAIClient):
     """
     Create the LangGraph state graph for agent workflow.
     
-    The workflow consists of three sequential nodes:
+    The workflow fans out into two independent nodes that run concurrently,
+    then joins into a single synthesis node:
     1. understand_query: Analyze user intent
-    2. process_query: Generate detailed analysis
-    3. generate_response: Synthesize final response
+    2. process_query: Generate detailed analysis (in parallel with 1)
+    3. generate_response: Synthesize final response once both complete
     
     Args:
         llm_client: OpenAI client for LLM calls
@@ -27,62 +30,72 @@ def create_agent_graph(llm_client: OpenAIClient):
     Returns:
         Compiled StateGraph for agent execution
     """
-    workflow = StateGraph(dict)
+    workflow = StateGraph(AgentStateDict)
     
     # Add nodes to the graph
     # Each node receives the LLM client for making API calls
     workflow.add_node(
         "understand_query",
-        lambda state: understand_query_node(state, llm_client)
+        partial(understand_query_node, llm_client=llm_client)
     )
     workflow.add_node(
         "process_query",
-        lambda state: process_query_node(state, llm_client)
+        partial(process_query_node, llm_client=llm_client)
     )
     workflow.add_node(
         "generate_response",
-        lambda state: generate_response_node(state, llm_client)
+        partial(generate_response_node, llm_client=llm_client)
     )
     
     # Define the workflow edges (connections between nodes)
-    workflow.set_entry_point("understand_query")
-    workflow.add_edge("understand_query", "process_query")
-    workflow.add_edge("process_query", "generate_response")
+    # Both analysis nodes start from the entry point and run in the same step;
+    # generate_response waits for both before synthesizing.
+    workflow.add_edge(START, "understand_query")
+    workflow.add_edge(START, "process_query")
+    workflow.add_edge(["understand_query", "process_query"], "generate_response")
     workflow.add_edge("generate_response", END)
     
     # Compile and return the graph
     return workflow.compile()
 
 
+# Static description of the workflow above, built once at import
+_GRAPH_STRUCTURE: Dict[str, Any] = {
+    "nodes": [
+        {
+            "id": "understand_query",
+            "label": "Query Understanding",
+            "description": "Analyze user intent and extract key topics"
+        },
+        {
+            "id": "process_query",
+            "label": "Query Processing",
+            "description": "Generate detailed analysis with context"
+        },
+        {
+            "id": "generate_response",
+            "label": "Response Generation",
+            "description": "Synthesize final actionable response"
+        }
+    ],
+    "edges": [
+        {"from": "START", "to": "understand_query"},
+        {"from": "START", "to": "process_query"},
+        {"from": "understand_query", "to": "generate_response"},
+        {"from": "process_query", "to": "generate_response"},
+        {"from": "generate_response", "to": "END"}
+    ],
+    "entry_point": ["understand_query", "process_query"]
+}
+
+
 def get_graph_structure() -> Dict[str, Any]:
     """
     Get the structure of the agent's graph for visualization and debugging.
     
+    The returned dict is shared; callers should treat it as read-only.
+    
     Returns:
         Dict describing the graph structure
     """
-    return {
-        "nodes": [
-            {
-                "id": "understand_query",
-                "label": "Query Understanding",
-                "description": "Analyze user intent and extract key topics"
-            },
-            {
-                "id": "process_query",
-                "label": "Query Processing",
-                "description": "Generate detailed analysis with context"
-            },
-            {
-                "id": "generate_response",
-                "label": "Response Generation",
-                "description": "Synthesize final actionable response"
-            }
-        ],
-        "edges": [
-            {"from": "understand_query", "to": "process_query"},
-            {"from": "process_query", "to": "generate_response"},
-            {"from": "generate_response", "to": "END"}
-        ],
-        "entry_point": "understand_query"
-    }
+    return _GRAPH_STRUCTURE
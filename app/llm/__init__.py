@@ -2,6 +2,7 @@
 LLM module for handling OpenAI API communication
 """
 
-from .openai_client import OpenAIClient
+from .openai_client import OpenAIClient, close_shared_http_client
+from .response_cache import ResponseCache
 
-__all__ = ["OpenAIClient"]
+__all__ = ["OpenAIClient", "ResponseCache", "close_shared_http_client"]
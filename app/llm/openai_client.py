@@ -2,11 +2,85 @@
 OpenAI LLM client wrapper for centralized API communication management
 """
 
+import asyncio
+import httpx
 from langchain_openai import ChatOpenAI
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator
 from app.config import Settings
 
 
+# Connection pool shared by every OpenAI client in the process so that
+# concurrent LLM calls reuse warm TLS connections to api.openai.com.
+# HTTP/2 multiplexes parallel graph-node calls over a single connection.
+_shared_http_client: Optional[httpx.AsyncClient] = None
+
+# Caps in-flight LLM requests across the whole process so bursts of
+# concurrent API calls queue locally instead of tripping OpenAI rate limits
+_llm_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def get_shared_http_client(settings: Settings) -> httpx.AsyncClient:
+    """
+    Get the process-wide async HTTP client used for OpenAI requests.
+    
+    The client is created on first use with pool limits from settings.
+    Keep max_keepalive_connections at or above llm_max_concurrency. No
+    timeout is set here: the OpenAI SDK sends its own per-request timeout,
+    which overrides the client default.
+    
+    Args:
+        settings: Application settings containing connection pool limits
+        
+    Returns:
+        Shared httpx.AsyncClient instance
+    """
+    global _shared_http_client
+    
+    if _shared_http_client is None or _shared_http_client.is_closed:
+        _shared_http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=settings.llm_max_connections,
+                max_keepalive_connections=settings.llm_max_keepalive_connections
+            )
+        )
+    return _shared_http_client
+
+
+async def close_shared_http_client() -> None:
+    """
+    Close the shared HTTP client, releasing pooled connections.
+    
+    Also drops the LLM semaphore, which is bound to the event loop that first
+    used it, so a later startup on a new loop gets fresh instances of both.
+    """
+    global _shared_http_client, _llm_semaphore
+    
+    if _shared_http_client is not None:
+        await _shared_http_client.aclose()
+        _shared_http_client = None
+    _llm_semaphore = None
+
+
+def get_llm_semaphore(settings: Settings) -> asyncio.Semaphore:
+    """
+    Get the process-wide semaphore bounding concurrent LLM requests.
+    
+    Size it to the account's rate limit tier via LLM_MAX_CONCURRENCY.
+    
+    Args:
+        settings: Application settings containing the concurrency limit
+        
+    Returns:
+        Shared asyncio.Semaphore instance
+    """
+    global _llm_semaphore
+    
+    if _llm_semaphore is None:
+        _llm_semaphore = asyncio.Semaphore(settings.llm_max_concurrency)
+    return _llm_semaphore
+
+
 class OpenAIClient:
     """
     Wrapper for OpenAI ChatGPT LLM client.
@@ -27,6 +101,7 @@ class OpenAIClient:
         """
         self.settings = settings
         self.client = self._initialize_client()
+        self.semaphore = get_llm_semaphore(settings)
     
     def _initialize_client(self) -> ChatOpenAI:
         """
@@ -45,20 +120,45 @@ class OpenAIClient:
             model=self.settings.agent_model,
             temperature=self.settings.agent_temperature,
             max_tokens=self.settings.agent_max_tokens,
-            openai_api_key=self.settings.openai_api_key
+            openai_api_key=self.settings.openai_api_key,
+            timeout=self.settings.llm_request_timeout_seconds,
+            http_async_client=get_shared_http_client(self.settings)
         )
     
     async def invoke(self, messages: list) -> Any:
         """
         Invoke the LLM with messages.
         
+        Waits for a free slot when LLM_MAX_CONCURRENCY requests are in flight.
+        The request timeout bounds how long a stalled call can hold a slot.
+        
         Args:
             messages: List of messages to process
             
         Returns:
             LLM response
         """
-        return await self.client.ainvoke(messages)
+        async with self.semaphore:
+            return await self.client.ainvoke(messages)
+    
+    async def stream(self, messages: list) -> AsyncIterator[str]:
+        """
+        Stream the LLM response token by token.
+        
+        Holds a concurrency slot for the lifetime of the stream, including
+        while the consumer is slow to read, so slow streaming clients count
+        against LLM_MAX_CONCURRENCY.
+        
+        Args:
+            messages: List of messages to process
+            
+        Yields:
+            Non-empty chunks of response text as they arrive
+        """
+        async with self.semaphore:
+            async for chunk in self.client.astream(messages):
+                if chunk.content:
+                    yield chunk.content
     
     def get_client(self) -> ChatOpenAI:
         """Get the underlying ChatOpenAI client"""
@@ -0,0 +1,100 @@
+"""
+In-memory response cache for LLM calls
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+
+class ResponseCache:
+    """
+    TTL + LRU cache for LLM responses.
+    
+    Repeated queries (e.g. the same ticker analyzed several times within a
+    session) are answered from memory instead of paying for another LLM
+    round-trip. Entries expire after `ttl_seconds`, and the least recently
+    used entry is evicted once `max_entries` is reached.
+    """
+    
+    def __init__(self, ttl_seconds: int, max_entries: int):
+        """
+        Initialize the cache.
+        
+        Args:
+            ttl_seconds: Time-to-live for each entry; 0 disables caching
+            max_entries: Maximum number of entries kept in memory
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything at all"""
+        return self.ttl_seconds > 0 and self.max_entries > 0
+    
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """
+        Build a cache key from the given parts.
+        
+        Args:
+            parts: Strings identifying the request (model, prompt, ...)
+            
+        Returns:
+            SHA-256 hex digest of the parts
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            encoded = part.encode("utf-8")
+            # Length-prefix each part so ("ab", "c") and ("a", "bc") differ
+            digest.update(len(encoded).to_bytes(8, "big"))
+            digest.update(encoded)
+        return digest.hexdigest()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached response.
+        
+        Args:
+            key: Cache key from make_key
+            
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a response in the cache.
+        
+        Args:
+            key: Cache key from make_key
+            value: Response to cache
+        """
+        if not self.enabled:
+            return
+        
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all cached responses"""
+        self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,63 @@
+"""
+Logging configuration for the application.
+
+Records from the `app` logger hierarchy go through a QueueHandler, so request
+handlers only enqueue them; formatting output and writing to stderr happen on
+a background QueueListener thread instead of blocking the event loop.
+"""
+
+import logging
+import logging.handlers
+import queue
+import sys
+from typing import Optional
+
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def setup_logging(level: str = "INFO") -> None:
+    """
+    Attach the queue-based handler to the `app` logger and start the listener.
+    
+    Safe to call more than once; later calls only update the level.
+    
+    Args:
+        level: Log level name for the `app` logger (e.g. "INFO", "DEBUG")
+    """
+    global _queue_handler, _listener
+    
+    app_logger = logging.getLogger("app")
+    app_logger.setLevel(level)
+    
+    if _listener is not None:
+        return
+    
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s")
+    )
+    
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    _listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, respect_handler_level=True
+    )
+    
+    app_logger.addHandler(_queue_handler)
+    app_logger.propagate = False
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """Flush pending records and stop the background listener thread"""
+    global _queue_handler, _listener
+    
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    
+    if _queue_handler is not None:
+        logging.getLogger("app").removeHandler(_queue_handler)
+        _queue_handler = None
@@ -2,14 +2,18 @@
 Stock analysis service for AI-powered stock analysis operations.
 """
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from typing import Dict, Any, Optional
 from datetime import datetime
 import json
+import logging
 
 from app.database.models import ApiUsage, User
 from app.agent import StockAgent
 
+logger = logging.getLogger(__name__)
+
 
 class StockAnalysisService:
     """
@@ -58,7 +62,7 @@ class StockAnalysisService:
             }
             
         except Exception as e:
-            print(f"❌ Agent error: {type(e).__name__}: {str(e)}")
+            logger.error("Agent error: %s: %s", type(e).__name__, e)
             raise e
     
     def get_user_usage_stats(self, user_id: str, limit: int = 10) -> Dict[str, Any]:
@@ -72,18 +76,29 @@ class StockAnalysisService:
         Returns:
             Dictionary with usage statistics
         """
-        # Get total request count
-        total_requests = self.db.query(ApiUsage).filter(
-            ApiUsage.user_id == user_id
-        ).count()
-        
-        # Get recent requests
-        recent_requests = self.db.query(ApiUsage).filter(
+        # Fetch the recent requests and the user's total in one round-trip:
+        # the window count is evaluated over all matching rows before LIMIT
+        recent_requests = self.db.query(
+            ApiUsage.endpoint,
+            ApiUsage.ticker,
+            ApiUsage.response_status,
+            ApiUsage.created_at,
+            func.count().over().label("total_requests")
+        ).filter(
             ApiUsage.user_id == user_id
         ).order_by(
             ApiUsage.created_at.desc()
         ).limit(limit).all()
         
+        if recent_requests:
+            total_requests = recent_requests[0].total_requests
+        elif limit > 0:
+            total_requests = 0
+        else:
+            total_requests = self.db.query(ApiUsage).filter(
+                ApiUsage.user_id == user_id
+            ).count()
+        
         return {
             "user_id": user_id,
             "total_requests": total_requests,
@@ -2,6 +2,7 @@
 User service for user management and authentication.
 """
 
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from typing import Optional
 from app.database.models import User
@@ -67,6 +68,11 @@ class UserService:
         """
         Get existing user or create new one if doesn't exist.
         
+        Existing users cost a single SELECT. New users are created with one
+        INSERT ... ON CONFLICT DO NOTHING RETURNING statement, which also
+        makes concurrent first requests for the same user safe instead of
+        failing with an IntegrityError.
+        
         Args:
             user_id: Unique user identifier
             email: User's email address
@@ -76,8 +82,24 @@ class UserService:
             User object
         """
         user = self.get_user_by_id(user_id)
-        if not user:
-            user = self.create_user(user_id, email, username)
+        if user:
+            return user
+        
+        stmt = insert(User).values(
+            id=user_id,
+            email=email,
+            username=username,
+            is_active=True
+        ).on_conflict_do_nothing(
+            index_elements=[User.id]
+        ).returning(User)
+        
+        user = self.db.scalars(stmt).first()
+        self.db.commit()
+        
+        # Another request inserted the same user between our SELECT and INSERT
+        if user is None:
+            user = self.get_user_by_id(user_id)
         return user
     
     def deactivate_user(self, user_id: str) -> bool:
@@ -8,15 +8,18 @@ Includes API layer, service layer, and database layer for authenticated stock an
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 import os
 from dotenv import load_dotenv
 
-from app.agent import StockAgent
+from app.agent import StockAgent, close_agent_resources
 from app.config import Settings, get_settings
 from app.database import engine, Base
 from app.api.v1 import api_router
+from app.api.middleware import close_http_client as close_auth_http_client
+from app.logging_config import setup_logging, shutdown_logging
 
 # Load environment variables
 load_dotenv()
@@ -31,6 +34,7 @@ async def lifespan(app: FastAPI):
     # Startup
     global stock_agent
     settings = get_settings()
+    setup_logging(settings.log_level)
     
     # Initialize database tables
     try:
@@ -63,6 +67,9 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     print("Shutting down gracefully...")
+    await close_agent_resources()
+    await close_auth_http_client()
+    shutdown_logging()
 
 
 # Initialize FastAPI app
@@ -124,7 +131,16 @@ class HealthResponse(BaseModel):
     version: str
 
 
+class AgentInfoResponse(BaseModel):
+    """Agent configuration response model"""
+    model: str
+    temperature: float
+    max_tokens: int
+    status: str
+
+
 @app.get("/", response_model=HealthResponse)
+@app.get("/health", response_model=HealthResponse)
 async def root(settings: Settings = Depends(get_settings)):
     """Root endpoint - Health check"""
     return HealthResponse(
@@ -134,7 +150,6 @@ async def root(settings: Settings = Depends(get_settings)):
     )
 
 
-@app.get("/health", response_model=HealthResponse)
 @app.post("/query", response_model=QueryResponse)
 async def query_agent(
     request: QueryRequest,
@@ -157,35 +172,58 @@ async def query_agent(
             query=request.query,
             context=request.context
         )
-        return QueryResponse(
-            response=response["response"],
-            metadata=response.get("metadata")
-        )
+        return QueryResponse(response=response)
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Error processing query: {str(e)}"
         )
-        return QueryResponse(
-            response=response["response"],
-            metadata=response.get("metadata")
-        )
+
+
+@app.post("/query/stream")
+async def stream_query_agent(
+    request: QueryRequest,
+    agent: Optional[StockAgent] = Depends(get_agent_from_state)
+):
+    """
+    Query the AI agent and stream the response as plain text.
+    
+    Tokens are sent as soon as the model produces them, so clients can
+    start rendering before the full response is complete.
+    """
+    if agent is None:
+        raise HTTPException(status_code=503, detail="Agent not initialized")
+    
+    # Wait for the first chunk before sending headers, so failures before the
+    # first token (bad key, rate limit, timeout) return a 500 like /query
+    chunks = agent.stream_query(query=request.query, context=request.context)
+    try:
+        first_chunk = await chunks.__anext__()
+    except StopAsyncIteration:
+        first_chunk = ""
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Error processing query: {str(e)}"
         )
+    
+    async def stream_response():
+        yield first_chunk
+        async for chunk in chunks:
+            yield chunk
+    
+    return StreamingResponse(stream_response(), media_type="text/plain")
 
 
-@app.get("/agent/info")
+@app.get("/agent/info", response_model=AgentInfoResponse)
 async def agent_info(settings: Settings = Depends(get_settings)):
     """Get information about the AI agent configuration"""
-    return {
-        "model": settings.agent_model,
-        "temperature": settings.agent_temperature,
-        "max_tokens": settings.agent_max_tokens,
-        "status": "active" if stock_agent else "not initialized"
-    }
+    return AgentInfoResponse(
+        model=settings.agent_model,
+        temperature=settings.agent_temperature,
+        max_tokens=settings.agent_max_tokens,
+        status="active" if stock_agent else "not initialized"
+    )
 
 
 if __name__ == "__main__":